@@ -4,13 +4,11 @@ from __future__ import annotations
 
 import typing as t
 from datetime import datetime, timezone
-from importlib import resources
 
 from singer_sdk.streams.core import REPLICATION_FULL_TABLE
 
 from tap_linkedin_ads.streams.base_stream import LinkedInAdsStreamBase
 
-SCHEMAS_DIR = resources.files(__package__) / "schemas"
 UTC = timezone.utc
 
 
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import typing as t
 from datetime import timezone
-from importlib import resources
 
 import pendulum
 from singer_sdk.typing import (
@@ -21,7 +20,6 @@ from tap_linkedin_ads.streams.streams import CampaignsStream
 if t.TYPE_CHECKING:
     from singer_sdk.helpers.types import Context
 
-SCHEMAS_DIR = resources.files(__package__) / "schemas"
 UTC = timezone.utc
 
 
@@ -3,152 +3,159 @@
 from __future__ import annotations
 
 import typing as t
-from datetime import timezone
-from importlib import resources
+from collections import deque
+from datetime import date, timedelta, timezone
+from functools import lru_cache
 
 import pendulum
-from singer_sdk.typing import (
-    IntegerType,
-    ObjectType,
-    PropertiesList,
-    Property,
-    StringType,
-)
+from singer_sdk.helpers._typing import TypeConformanceLevel
 
 from tap_linkedin_ads.streams.ad_analytics.ad_analytics_base import AdAnalyticsBase
-from tap_linkedin_ads.streams.streams import CreativesStream
+from tap_linkedin_ads.streams.streams import AccountsStream
 
 if t.TYPE_CHECKING:
+    import requests
     from singer_sdk.helpers.types import Context
 
-SCHEMAS_DIR = resources.files(__package__) / "schemas"
 UTC = timezone.utc
 
+_CREATIVE_SCHEMA: dict = {
+    "type": "object",
+    "properties": {
+        "landingPageClicks": {"type": ["integer", "null"]},
+        "reactions": {"type": ["integer", "null"]},
+        "adUnitClicks": {"type": ["integer", "null"]},
+        "account_id": {"type": ["integer", "null"]},
+        "creative_id": {"type": ["string", "null"]},
+        "documentCompletions": {"type": ["integer", "null"]},
+        "documentFirstQuartileCompletions": {"type": ["integer", "null"]},
+        "clicks": {"type": ["integer", "null"]},
+        "documentMidpointCompletions": {"type": ["integer", "null"]},
+        "documentThirdQuartileCompletions": {"type": ["integer", "null"]},
+        "downloadClicks": {"type": ["integer", "null"]},
+        "jobApplications": {"type": ["string", "null"]},
+        "jobApplyClicks": {"type": ["string", "null"]},
+        "postViewJobApplications": {"type": ["string", "null"]},
+        "costInUsd": {"type": ["string", "null"]},
+        "postViewRegistrations": {"type": ["string", "null"]},
+        "registrations": {"type": ["string", "null"]},
+        "talentLeads": {"type": ["integer", "null"]},
+        "viralDocumentCompletions": {"type": ["integer", "null"]},
+        "viralDocumentFirstQuartileCompletions": {"type": ["integer", "null"]},
+        "viralDocumentMidpointCompletions": {"type": ["integer", "null"]},
+        "viralDocumentThirdQuartileCompletions": {"type": ["integer", "null"]},
+        "viralDownloadClicks": {"type": ["integer", "null"]},
+        "viralJobApplications": {"type": ["string", "null"]},
+        "viralJobApplyClicks": {"type": ["string", "null"]},
+        "costInLocalCurrency": {"type": ["string", "null"]},
+        "viralRegistrations": {"type": ["integer", "null"]},
+        "approximateUniqueImpressions": {"type": ["integer", "null"]},
+        "cardClicks": {"type": ["integer", "null"]},
+        "cardImpressions": {"type": ["integer", "null"]},
+        "commentLikes": {"type": ["integer", "null"]},
+        "viralCardClicks": {"type": ["integer", "null"]},
+        "viralCardImpressions": {"type": ["integer", "null"]},
+        "viralCommentLikes": {"type": ["integer", "null"]},
+        "actionClicks": {"type": ["integer", "null"]},
+        "comments": {"type": ["integer", "null"]},
+        "companyPageClicks": {"type": ["integer", "null"]},
+        "conversionValueInLocalCurrency": {"type": ["string", "null"]},
+        "dateRange_start_year": {"type": ["integer", "null"]},
+        "dateRange_start_month": {"type": ["integer", "null"]},
+        "dateRange_start_day": {"type": ["integer", "null"]},
+        "dateRange_end_year": {"type": ["integer", "null"]},
+        "dateRange_end_month": {"type": ["integer", "null"]},
+        "dateRange_end_day": {"type": ["integer", "null"]},
+        "day": {"type": ["string", "null"]},
+        "externalWebsiteConversions": {"type": ["integer", "null"]},
+        "externalWebsitePostClickConversions": {"type": ["integer", "null"]},
+        "externalWebsitePostViewConversions": {"type": ["integer", "null"]},
+        "follows": {"type": ["integer", "null"]},
+        "fullScreenPlays": {"type": ["integer", "null"]},
+        "impressions": {"type": ["integer", "null"]},
+        "leadGenerationMailContactInfoShares": {"type": ["integer", "null"]},
+        "leadGenerationMailInterestedClicks": {"type": ["integer", "null"]},
+        "likes": {"type": ["integer", "null"]},
+        "oneClickLeadFormOpens": {"type": ["integer", "null"]},
+        "oneClickLeads": {"type": ["integer", "null"]},
+        "opens": {"type": ["integer", "null"]},
+        "otherEngagements": {"type": ["integer", "null"]},
+        "sends": {"type": ["integer", "null"]},
+        "shares": {"type": ["integer", "null"]},
+        "textUrlClicks": {"type": ["integer", "null"]},
+        "totalEngagements": {"type": ["integer", "null"]},
+        "videoCompletions": {"type": ["integer", "null"]},
+        "videoFirstQuartileCompletions": {"type": ["integer", "null"]},
+        "videoMidpointCompletions": {"type": ["integer", "null"]},
+        "videoStarts": {"type": ["integer", "null"]},
+        "videoThirdQuartileCompletions": {"type": ["integer", "null"]},
+        "videoViews": {"type": ["integer", "null"]},
+        "viralClicks": {"type": ["integer", "null"]},
+        "viralComments": {"type": ["integer", "null"]},
+        "viralCompanyPageClicks": {"type": ["integer", "null"]},
+        "viralExternalWebsiteConversions": {"type": ["integer", "null"]},
+        "viralExternalWebsitePostClickConversions": {"type": ["integer", "null"]},
+        "viralExternalWebsitePostViewConversions": {"type": ["integer", "null"]},
+        "viralFollows": {"type": ["integer", "null"]},
+        "viralFullScreenPlays": {"type": ["integer", "null"]},
+        "viralImpressions": {"type": ["integer", "null"]},
+        "viralLandingPageClicks": {"type": ["integer", "null"]},
+        "viralLikes": {"type": ["integer", "null"]},
+        "viralOneClickLeadFormOpens": {"type": ["integer", "null"]},
+        "viralOneclickLeads": {"type": ["integer", "null"]},
+        "viralOtherEngagements": {"type": ["integer", "null"]},
+        "viralReactions": {"type": ["integer", "null"]},
+        "viralShares": {"type": ["integer", "null"]},
+        "viralTotalEngagements": {"type": ["integer", "null"]},
+        "viralVideoCompletions": {"type": ["integer", "null"]},
+        "viralVideoFirstQuartileCompletions": {"type": ["integer", "null"]},
+        "viralVideoMidpointCompletions": {"type": ["integer", "null"]},
+        "viralVideoStarts": {"type": ["integer", "null"]},
+        "viralVideoThirdQuartileCompletions": {"type": ["integer", "null"]},
+        "viralVideoViews": {"type": ["integer", "null"]},
+    },
+}
+
+_INT_FIELDS = frozenset(
+    name
+    for name, spec in _CREATIVE_SCHEMA["properties"].items()
+    if "integer" in spec.get("type", ())
+)
 
-class _AdAnalyticsByCreativeInit(AdAnalyticsBase):
-    name = "AdAnalyticsByCreativeInit"
-    parent_stream_type = CreativesStream
-
-    schema = PropertiesList(
-        Property("landingPageClicks", IntegerType),
-        Property("reactions", IntegerType),
-        Property("adUnitClicks", IntegerType),
-        Property("creative_id", StringType),
-        Property("documentCompletions", IntegerType),
-        Property("documentFirstQuartileCompletions", IntegerType),
-        Property("clicks", IntegerType),
-        Property("documentMidpointCompletions", IntegerType),
-        Property("documentThirdQuartileCompletions", IntegerType),
-        Property("downloadClicks", IntegerType),
-        Property("jobApplications", StringType),
-        Property("jobApplyClicks", StringType),
-        Property("postViewJobApplications", StringType),
-        Property("costInUsd", StringType),
-        Property("postViewRegistrations", StringType),
-        Property("registrations", StringType),
-        Property("talentLeads", IntegerType),
-        Property("viralDocumentCompletions", IntegerType),
-        Property("viralDocumentFirstQuartileCompletions", IntegerType),
-        Property("viralDocumentMidpointCompletions", IntegerType),
-        Property("viralDocumentThirdQuartileCompletions", IntegerType),
-        Property("viralDownloadClicks", IntegerType),
-        Property("viralJobApplications", StringType),
-        Property("viralJobApplyClicks", StringType),
-        Property("costInLocalCurrency", StringType),
-        Property("viralRegistrations", IntegerType),
-        Property("approximateUniqueImpressions", IntegerType),
-        Property("cardClicks", IntegerType),
-        Property("cardImpressions", IntegerType),
-        Property("commentLikes", IntegerType),
-        Property("viralCardClicks", IntegerType),
-        Property("viralCardImpressions", IntegerType),
-        Property("viralCommentLikes", IntegerType),
-        Property("actionClicks", IntegerType),
-        Property("comments", IntegerType),
-        Property("companyPageClicks", IntegerType),
-        Property("conversionValueInLocalCurrency", StringType),
-        Property(
-            "dateRange",
-            ObjectType(
-                Property(
-                    "end",
-                    ObjectType(
-                        Property("day", IntegerType),
-                        Property("month", IntegerType),
-                        Property("year", IntegerType),
-                        additional_properties=False,
-                    ),
-                ),
-                Property(
-                    "start",
-                    ObjectType(
-                        Property("day", IntegerType),
-                        Property("month", IntegerType),
-                        Property("year", IntegerType),
-                        additional_properties=False,
-                    ),
-                ),
-            ),
-        ),
-        Property("day", StringType),
-        Property("externalWebsiteConversions", IntegerType),
-        Property("externalWebsitePostClickConversions", IntegerType),
-        Property("externalWebsitePostViewConversions", IntegerType),
-        Property("follows", IntegerType),
-        Property("fullScreenPlays", IntegerType),
-        Property("impressions", IntegerType),
-        Property("landingPageClicks", IntegerType),
-        Property("leadGenerationMailContactInfoShares", IntegerType),
-        Property("leadGenerationMailInterestedClicks", IntegerType),
-        Property("likes", IntegerType),
-        Property("oneClickLeadFormOpens", IntegerType),
-        Property("oneClickLeads", IntegerType),
-        Property("opens", IntegerType),
-        Property("otherEngagements", IntegerType),
-        Property("sends", IntegerType),
-        Property("shares", IntegerType),
-        Property("textUrlClicks", IntegerType),
-        Property("totalEngagements", IntegerType),
-        Property("videoCompletions", IntegerType),
-        Property("videoFirstQuartileCompletions", IntegerType),
-        Property("videoMidpointCompletions", IntegerType),
-        Property("videoStarts", IntegerType),
-        Property("videoThirdQuartileCompletions", IntegerType),
-        Property("videoViews", IntegerType),
-        Property("viralClicks", IntegerType),
-        Property("viralComments", IntegerType),
-        Property("viralCompanyPageClicks", IntegerType),
-        Property("viralExternalWebsiteConversions", IntegerType),
-        Property("viralExternalWebsitePostClickConversions", IntegerType),
-        Property("viralExternalWebsitePostViewConversions", IntegerType),
-        Property("viralFollows", IntegerType),
-        Property("viralFullScreenPlays", IntegerType),
-        Property("viralImpressions", IntegerType),
-        Property("viralLandingPageClicks", IntegerType),
-        Property("viralLikes", IntegerType),
-        Property("viralOneClickLeadFormOpens", IntegerType),
-        Property("viralOneclickLeads", IntegerType),
-        Property("viralOtherEngagements", IntegerType),
-        Property("viralReactions", IntegerType),
-        Property("viralShares", IntegerType),
-        Property("viralTotalEngagements", IntegerType),
-        Property("viralVideoCompletions", IntegerType),
-        Property("viralVideoFirstQuartileCompletions", IntegerType),
-        Property("viralVideoMidpointCompletions", IntegerType),
-        Property("viralVideoStarts", IntegerType),
-        Property("viralVideoThirdQuartileCompletions", IntegerType),
-        Property("viralVideoViews", IntegerType),
-    ).to_dict()
-
-    @property
-    def adanalyticscolumns(self) -> list[str]:
-        """List of columns for adanalytics endpoint."""
-        return [
-            "clicks,videoMidpointCompletions,videoCompletions,dateRange",
-            "costInUsd,landingPageClicks,totalEngagements,videoViews,commentLikes",
-            "videoThirdQuartileCompletions,likes,comments,fullScreenPlays,videoStarts,videoFirstQuartileCompletions,follows,costInLocalCurrency",
-            "impressions",
-        ]
+
+@lru_cache(maxsize=4)
+def _parse_date_components(value: str) -> tuple[int, int, int]:
+    """Parse a config date string into its year, month and day components."""
+    parsed = pendulum.parse(value)
+    return parsed.year, parsed.month, parsed.day
+
+
+class AdAnalyticsByCreativeStream(AdAnalyticsBase):
+    """https://docs.microsoft.com/en-us/linkedin/marketing/integrations/ads-reporting/ads-reporting#analytics-finder."""
+
+    name = "ad_analytics_by_creative"
+    parent_stream_type = AccountsStream
+
+    schema = _CREATIVE_SCHEMA
+
+    # Integer metrics are coerced in parse_response and dateRange is flattened into
+    # plain int columns, so only root-level properties need conforming
+    TYPE_CONFORMANCE_LEVEL = TypeConformanceLevel.ROOT_ONLY
+
+    # Columns for the adanalytics endpoint. The API accepts up to 20 fields per request
+    # and these fit in one, so no column-subset requests need merging.
+    _ADANALYTICS_FIELDS: t.ClassVar[str] = (
+        "dateRange,pivotValues,clicks,videoMidpointCompletions,videoCompletions,"
+        "costInUsd,landingPageClicks,totalEngagements,videoViews,commentLikes,"
+        "videoThirdQuartileCompletions,likes,comments,fullScreenPlays,videoStarts,"
+        "videoFirstQuartileCompletions,follows,costInLocalCurrency,impressions"
+    )
+
+    # The analytics finder does not paginate and returns at most this many elements.
+    # Requests are split into date windows so that creatives x days stays below it,
+    # and a window whose response reaches the limit is halved and requested again.
+    _MAX_ELEMENTS: t.ClassVar[int] = 15000
+    _DATE_WINDOW_DAYS: t.ClassVar[int] = 30
 
     def get_url_params(
         self,
@@ -164,65 +171,70 @@ class _AdAnalyticsByCreativeInit(AdAnalyticsBase):
         Returns:
             A dictionary of URL query parameters.
         """
-        return {
-            "q": "analytics",
-            **super().get_url_params(context, next_page_token),
-        }
-
-    def get_unencoded_params(self, context: Context) -> dict:
-        """Return a dictionary of unencoded params.
+        params = super().get_url_params(context, next_page_token)
+        params["q"] = "analytics"
+        return params
 
-        Args:
-            context: The stream context.
+    def _config_date_range(self) -> tuple[date, date]:
+        """Return the configured start and end dates.
 
         Returns:
-            A dictionary of URL query parameters.
+            The start_date and end_date settings as dates.
         """
-        start_date = pendulum.parse(self.config["start_date"])
-        end_date = pendulum.parse(self.config["end_date"])
-        return {
-            "pivot": "CREATIVE",
-            "timeGranularity": "DAILY",
-            "creatives": f"urn:li:sponsoredCreative:{context['creative_id']}",
-            "dateRange.start.year": start_date.year,
-            "dateRange.start.month": start_date.month,
-            "dateRange.start.day": start_date.day,
-            "dateRange.end.year": end_date.year,
-            "dateRange.end.month": end_date.month,
-            "dateRange.end.day": end_date.day,
-            "fields": ",".join(self.adanalyticscolumns),
-        }
-
-
-    def post_process(self, row: dict, context: dict | None = None) -> dict | None:
-        viral_registrations = row.pop("viralRegistrations", None)
-        if viral_registrations:
-            row["viralRegistrations"] = int(viral_registrations)
-
-        return super().post_process(row, context)
-
+        return (
+            date(*_parse_date_components(self.config["start_date"])),
+            date(*_parse_date_components(self.config["end_date"])),
+        )
 
-class _AdAnalyticsByCreativeSecond(_AdAnalyticsByCreativeInit):
-    name = "adanalyticsbycreative_second"
+    def get_records(self, context: Context | None) -> t.Iterable[dict[str, t.Any]]:
+        """Return records for the account, one date window at a time.
 
-    def get_unencoded_params(self, context: Context) -> dict:
-        """Return a dictionary of unencoded params.
+        Windows are ad_analytics_window_days long. When a response reaches the
+        adAnalytics element limit, its window is split in half and both halves are
+        requested again, down to a single day.
 
         Args:
             context: The stream context.
 
-        Returns:
-            A dictionary of URL query parameters.
+        Yields:
+            Each record from the source.
         """
-        return {
-            **super().get_unencoded_params(context),
-            # Overwrite fields with this column subset
-            "fields": self.adanalyticscolumns[2],
-        }
-
-
-class _AdAnalyticsByCreativeThird(_AdAnalyticsByCreativeInit):
-    name = "adanalyticsbycreative_third"
+        window_days = self.config.get(
+            "ad_analytics_window_days",
+            self._DATE_WINDOW_DAYS,
+        )
+        window_start, end_date = self._config_date_range()
+        windows: deque[tuple[date, date]] = deque()
+        while window_start <= end_date:
+            window_end = min(window_start + timedelta(days=window_days - 1), end_date)
+            windows.append((window_start, window_end))
+            window_start = window_end + timedelta(days=1)
+
+        while windows:
+            window_start, window_end = windows.popleft()
+            records = list(
+                super().get_records(
+                    {**(context or {}), "date_window": (window_start, window_end)},
+                ),
+            )
+            if len(records) >= self._MAX_ELEMENTS:
+                if window_start < window_end:
+                    midpoint = window_start + (window_end - window_start) // 2
+                    self.logger.info(
+                        "adAnalytics element limit reached for %s to %s, "
+                        "splitting the date window",
+                        window_start,
+                        window_end,
+                    )
+                    windows.appendleft((midpoint + timedelta(days=1), window_end))
+                    windows.appendleft((window_start, midpoint))
+                    continue
+                self.logger.warning(
+                    "adAnalytics element limit reached for the single day %s, "
+                    "records may be truncated",
+                    window_start,
+                )
+            yield from records
 
     def get_unencoded_params(self, context: Context) -> dict:
         """Return a dictionary of unencoded params.
@@ -233,68 +245,77 @@ class _AdAnalyticsByCreativeThird(_AdAnalyticsByCreativeInit):
         Returns:
             A dictionary of URL query parameters.
         """
+        start_date, end_date = context.get("date_window") or self._config_date_range()
         return {
-            **super().get_unencoded_params(context),
-            # Overwrite fields with this column subset
-            "fields": self.adanalyticscolumns[3],
+            "pivot": "CREATIVE",
+            "timeGranularity": "DAILY",
+            # Request every creative of the account at once, split out by pivotValues
+            "accounts": f"urn:li:sponsoredAccount:{context['account_id']}",
+            "dateRange.start.year": start_date.year,
+            "dateRange.start.month": start_date.month,
+            "dateRange.start.day": start_date.day,
+            "dateRange.end.year": end_date.year,
+            "dateRange.end.month": end_date.month,
+            "dateRange.end.day": end_date.day,
+            "fields": self._ADANALYTICS_FIELDS,
         }
 
+    def parse_response(self, response: requests.Response) -> t.Iterable[dict]:
+        """Parse the response and return an iterator of result records.
 
-class AdAnalyticsByCreativeStream(_AdAnalyticsByCreativeInit):
-    """https://docs.microsoft.com/en-us/linkedin/marketing/integrations/ads-reporting/ads-reporting#analytics-finder."""
-
-    name = "ad_analytics_by_creative"
-
-    def get_unencoded_params(self, context: Context) -> dict:
-        """Return a dictionary of unencoded params.
+        Reads the elements list directly rather than through records_jsonpath, and
+        converts integer metrics LinkedIn returns as strings while walking each row.
+        Empty strings become None. Other values that are not integers are logged and
+        set to None.
 
         Args:
-            context: The stream context.
+            response: The HTTP ``requests.Response`` object.
 
-        Returns:
-            A dictionary of URL query parameters.
+        Yields:
+            Each record from the source.
         """
-        return {
-            **super().get_unencoded_params(context),
-            # Overwrite fields with this column subset
-            "fields": self.adanalyticscolumns[1],
-        }
-
-    def get_records(self, context: dict | None) -> t.Iterable[dict[str, t.Any]]:
-        """Return a dictionary of records from adAnalytics classes.
-
-        Combines request columns from multiple calls to the api, which are limited to 20
-        columns each.
+        for row in response.json().get("elements", ()):
+            for key in _INT_FIELDS & row.keys():
+                value = row[key]
+                if type(value) is str:
+                    try:
+                        row[key] = int(value)
+                    except ValueError:
+                        if value:
+                            self.logger.warning(
+                                "Non-integer value %r for integer field %s",
+                                value,
+                                key,
+                            )
+                        row[key] = None
+            yield row
 
-        Uses `merge_dicts` to combine responses from each class
-        super().get_records calls only the records from adAnalyticsByCreative class
-        zip() Iterates over the records of adAnalytics classes and merges them with
-        merge_dicts() function list() converts each stream context into lists
+    def post_process(self, row: dict, context: dict | None = None) -> dict | None:
+        """Post-process each record returned by the API.
 
         Args:
-            context: The stream context.
+            row: Individual record in the stream.
+            context: Stream partition or context dictionary.
 
         Returns:
-            A dictionary of records given from adAnalytics streams
+            The resulting record dict, or `None` if the record should be excluded.
         """
-        adanalyticsinit_stream = _AdAnalyticsByCreativeInit(
-            self._tap,
-            schema={"properties": {}},
-        )
-        adanalyticsecond_stream = _AdAnalyticsByCreativeSecond(
-            self._tap,
-            schema={"properties": {}},
-        )
-        adanalyticsthird_stream = _AdAnalyticsByCreativeThird(
-            self._tap,
-            schema={"properties": {}},
-        )
-        return [
-            self.merge_dicts(x, y, z, p)
-            for x, y, z, p in zip(
-                list(adanalyticsinit_stream.get_records(context)),
-                list(super().get_records(context)),
-                list(adanalyticsecond_stream.get_records(context)),
-                list(adanalyticsthird_stream.get_records(context)),
-            )
-        ]
+        pivot_values = row.pop("pivotValues", None)
+        if pivot_values:
+            row["creative_id"] = pivot_values[0].split(":")[-1]
+
+        row = super().post_process(row, context)
+
+        # Flatten dateRange.{start,end}.{year,month,day} into top-level columns
+        date_range = row.pop("dateRange", None) if row else None
+        if date_range:
+            start = date_range.get("start", {})
+            end = date_range.get("end", {})
+            row["dateRange_start_year"] = start.get("year")
+            row["dateRange_start_month"] = start.get("month")
+            row["dateRange_start_day"] = start.get("day")
+            row["dateRange_end_year"] = end.get("year")
+            row["dateRange_end_month"] = end.get("month")
+            row["dateRange_end_day"] = end.get("day")
+
+        return row
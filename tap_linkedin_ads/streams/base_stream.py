@@ -132,15 +132,13 @@ class LinkedInAdsStreamBase(RESTStream):
                 #self.logger.info(context,next_page_token=paginator.current_value)
                 self.logger.info(prepared_request.url)
                 # Patch to add unencoded params to the path and url
-                if self.get_unencoded_params(context):
+                unencoded_params = self.get_unencoded_params(context)
+                if unencoded_params:
                     prepared_request.url = (
                         prepared_request.url
                         + "&"
                         + "&".join(
-                            [
-                                f"{k}={v}"
-                                for k, v in self.get_unencoded_params(context).items()
-                            ],
+                            [f"{k}={v}" for k, v in unencoded_params.items()],
                         )
                     )
                 self.logger.info(f'the url is {prepared_request.url}')
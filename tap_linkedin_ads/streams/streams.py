@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import typing as t
 from datetime import datetime, timezone
-from importlib import resources
 
 from singer_sdk.typing import (
     ArrayType,
@@ -23,7 +22,6 @@ if t.TYPE_CHECKING:
     from singer_sdk.helpers.types import Context
 from singer_sdk.streams.core import REPLICATION_INCREMENTAL
 
-SCHEMAS_DIR = resources.files(__package__) / "schemas"
 UTC = timezone.utc
 
 
@@ -73,6 +73,15 @@ class TapLinkedInAds(Tap):
             default="tap-linkedin-ads <api_user_email@your_company.com>",
             description="API ID",
         ),
+        th.Property(
+            "ad_analytics_window_days",
+            th.IntegerType,
+            default=30,
+            description=(
+                "Number of days requested per ad analytics by creative call. Windows "
+                "that reach the API's 15,000 element limit are split automatically"
+            ),
+        ),
     ).to_dict()
 
     def discover_streams(self) -> list[streams.LinkedInAdsStream]:
@@ -0,0 +1,261 @@
+"""Tests for the ad_analytics_by_creative stream that run without credentials."""
+
+from __future__ import annotations
+
+import datetime
+import json
+import typing as t
+
+import requests
+
+from tap_linkedin_ads.tap import TapLinkedInAds
+
+if t.TYPE_CHECKING:
+    import pytest
+
+    from tap_linkedin_ads.streams.ad_analytics.ad_analytics_by_creative import (
+        AdAnalyticsByCreativeStream,
+    )
+
+SAMPLE_CONFIG = {
+    "access_token": "dummy",
+    "start_date": "2024-01-01T00:00:00+00:00",
+    "end_date": "2024-03-05T00:00:00+00:00",
+}
+
+
+def _stream(**config: object) -> AdAnalyticsByCreativeStream:
+    tap = TapLinkedInAds(config={**SAMPLE_CONFIG, **config}, parse_env_config=False)
+    return tap.streams["ad_analytics_by_creative"]
+
+
+def _response(elements: list[dict]) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps({"elements": elements}).encode()  # noqa: SLF001
+    return response
+
+
+def _element(**metrics: object) -> dict:
+    return {
+        "pivotValues": ["urn:li:sponsoredCreative:987"],
+        "dateRange": {
+            "start": {"year": 2024, "month": 1, "day": 3},
+            "end": {"year": 2024, "month": 1, "day": 3},
+        },
+        **metrics,
+    }
+
+
+def test_unencoded_params_use_account_facet_and_config_dates() -> None:
+    """Without a date window, the request covers the configured date range."""
+    params = _stream().get_unencoded_params({"account_id": 123})
+
+    assert params["pivot"] == "CREATIVE"
+    assert params["timeGranularity"] == "DAILY"
+    assert params["accounts"] == "urn:li:sponsoredAccount:123"
+    assert params["fields"].split(",") == [
+        "dateRange",
+        "pivotValues",
+        "clicks",
+        "videoMidpointCompletions",
+        "videoCompletions",
+        "costInUsd",
+        "landingPageClicks",
+        "totalEngagements",
+        "videoViews",
+        "commentLikes",
+        "videoThirdQuartileCompletions",
+        "likes",
+        "comments",
+        "fullScreenPlays",
+        "videoStarts",
+        "videoFirstQuartileCompletions",
+        "follows",
+        "costInLocalCurrency",
+        "impressions",
+    ]
+    assert (
+        params["dateRange.start.year"],
+        params["dateRange.start.month"],
+        params["dateRange.start.day"],
+    ) == (2024, 1, 1)
+    assert (
+        params["dateRange.end.year"],
+        params["dateRange.end.month"],
+        params["dateRange.end.day"],
+    ) == (2024, 3, 5)
+
+
+def test_get_records_requests_one_date_window_at_a_time(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The configured date range is requested in consecutive 30-day windows."""
+    stream = _stream()
+    windows = []
+
+    def fake_request_records(context: dict) -> list:
+        params = stream.get_unencoded_params(context)
+        windows.append(
+            (
+                datetime.date(
+                    params["dateRange.start.year"],
+                    params["dateRange.start.month"],
+                    params["dateRange.start.day"],
+                ),
+                datetime.date(
+                    params["dateRange.end.year"],
+                    params["dateRange.end.month"],
+                    params["dateRange.end.day"],
+                ),
+            ),
+        )
+        return []
+
+    monkeypatch.setattr(stream, "request_records", fake_request_records)
+    list(stream.get_records({"account_id": 123}))
+
+    assert windows == [
+        (datetime.date(2024, 1, 1), datetime.date(2024, 1, 30)),
+        (datetime.date(2024, 1, 31), datetime.date(2024, 2, 29)),
+        (datetime.date(2024, 3, 1), datetime.date(2024, 3, 5)),
+    ]
+
+
+def test_window_size_comes_from_the_tap_setting(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The ad_analytics_window_days setting controls the date window length."""
+    stream = _stream(ad_analytics_window_days=40)
+    windows = []
+
+    def fake_request_records(context: dict) -> list:
+        windows.append(context["date_window"])
+        return []
+
+    monkeypatch.setattr(stream, "request_records", fake_request_records)
+    list(stream.get_records({"account_id": 123}))
+
+    assert windows == [
+        (datetime.date(2024, 1, 1), datetime.date(2024, 2, 9)),
+        (datetime.date(2024, 2, 10), datetime.date(2024, 3, 5)),
+    ]
+
+
+def test_window_reaching_element_limit_is_split(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A window whose response reaches the element limit is halved and re-requested."""
+    stream = _stream()
+    monkeypatch.setattr(stream, "_MAX_ELEMENTS", 10)
+    windows = []
+
+    def fake_request_records(context: dict) -> list:
+        window_start, window_end = context["date_window"]
+        windows.append((window_start, window_end))
+        days = (window_end - window_start).days + 1
+        rows = []
+        for offset in range(days):
+            day = window_start + datetime.timedelta(days=offset)
+            row = _element(clicks=1)
+            row["dateRange"] = {
+                "start": {"year": day.year, "month": day.month, "day": day.day},
+                "end": {"year": day.year, "month": day.month, "day": day.day},
+            }
+            rows.append(row)
+        return rows
+
+    monkeypatch.setattr(stream, "request_records", fake_request_records)
+    records = list(stream.get_records({"account_id": 123}))
+
+    assert [record["day"].date() for record in records] == [
+        datetime.date(2024, 1, 1) + datetime.timedelta(days=offset)
+        for offset in range(65)
+    ]
+    assert windows[:3] == [
+        (datetime.date(2024, 1, 1), datetime.date(2024, 1, 30)),
+        (datetime.date(2024, 1, 1), datetime.date(2024, 1, 15)),
+        (datetime.date(2024, 1, 1), datetime.date(2024, 1, 8)),
+    ]
+
+
+def test_records_are_demultiplexed_by_creative() -> None:
+    """Each analytics row is assigned to its creative via pivotValues."""
+    stream = _stream()
+    response = _response([_element(clicks=1)])
+
+    records = [stream.post_process(row) for row in stream.parse_response(response)]
+
+    assert len(records) == 1
+    assert records[0]["creative_id"] == "987"
+    assert records[0]["clicks"] == 1
+    assert "pivotValues" not in records[0]
+
+
+def test_date_range_is_flattened_after_day_is_derived() -> None:
+    """The dateRange object is flattened after day is derived from its start."""
+    stream = _stream()
+    row = _element(clicks=1)
+    row["dateRange"]["end"] = {"year": 2024, "month": 1, "day": 4}
+
+    record = stream.post_process(row)
+
+    assert "dateRange" not in record
+    assert "pivotValues" not in record
+    assert record["creative_id"] == "987"
+    assert record["day"] == datetime.datetime(2024, 1, 3, tzinfo=datetime.timezone.utc)
+    assert {key: record[key] for key in record if key.startswith("dateRange_")} == {
+        "dateRange_start_year": 2024,
+        "dateRange_start_month": 1,
+        "dateRange_start_day": 3,
+        "dateRange_end_year": 2024,
+        "dateRange_end_month": 1,
+        "dateRange_end_day": 4,
+    }
+
+
+def test_parse_response_converts_string_integer_metrics() -> None:
+    """Integer metrics sent as strings become ints; string metrics are left alone."""
+    stream = _stream()
+    response = _response(
+        [
+            _element(
+                clicks="12",
+                comments="-3",
+                follows=" 4",
+                impressions="",
+                likes=3,
+                costInUsd="1.50",
+            ),
+        ],
+    )
+
+    (row,) = stream.parse_response(response)
+
+    metrics = ("clicks", "comments", "follows", "impressions", "likes", "costInUsd")
+    assert {key: row[key] for key in metrics} == {
+        "clicks": 12,
+        "comments": -3,
+        "follows": 4,
+        "impressions": None,
+        "likes": 3,
+        "costInUsd": "1.50",
+    }
+
+
+def test_parse_response_logs_non_integer_metrics(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Strings that are not integers are logged and nulled instead of raising."""
+    stream = _stream()
+    response = _response([_element(clicks="\u00b2", videoViews="n/a")])
+    stream.logger.addHandler(caplog.handler)
+
+    try:
+        (row,) = stream.parse_response(response)
+    finally:
+        stream.logger.removeHandler(caplog.handler)
+
+    assert row["clicks"] is None
+    assert row["videoViews"] is None
+    assert "'n/a' for integer field videoViews" in caplog.text